@@ -22,12 +22,19 @@ CLI:
     python3 article_utils.py --fix-all   # repair hub links + mojibake + ext links
 """
 
-import json, os, re, sys
+import functools, json, multiprocessing, os, re, sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 
+try:
+    import orjson  # optional: faster JSON, byte-identical output with OPT_INDENT_2
+except ImportError:
+    orjson = None
+
 # ─── Constants ───────────────────────────────────────────────────────────────
 
 BRAND_SUFFIX = " | Cursed Tours"
+_BRAND_LEN = len(BRAND_SUFFIX)
 MAX_TITLE_RAW = 50
 MAX_RENDERED_TITLE = 65
 MIN_TITLE = 10
@@ -37,8 +44,12 @@ MIN_WORD_COUNT_CLUSTER = 500
 MIN_WORD_COUNT_PILLAR = 1200
 MIN_BODY_INTERNAL_LINKS = 2
 MIN_CONTINUE_READING_LINKS = 3
+PARALLEL_QC_MIN_ARTICLES = 200  # below this, process start-up costs more than QC itself
 ARTICLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "src", "data", "articles")
 
+_VALID_URLS_CACHE = None  # (key, urls) from the last _build_valid_urls scan
+_MADE_ARTICLE_DIR = None  # ARTICLE_DIR value _write_to_disk last ensured exists
+
 # Hub page mapping — must match CATEGORIES in src/data/articles.ts
 CATEGORY_HUBS = {
     'salem-witch-trials': '/salem-ghost-tours/',
@@ -77,6 +88,38 @@ MOJIBAKE_MAP = {
     '\u00e2\u20ac\u00a6': '\u2026',  # ellipsis
 }
 
+# Compiled patterns — shared by QC, editorial, repair and audit passes
+_RE_TAG_STRIP = re.compile(r'<[^>]+>')
+_RE_HREF_INTERNAL = re.compile(r'href="(/[^"]*)"')
+_RE_EXT_LINK_ATTR = re.compile(r'<a\s+href="(https?://[^"]+)"([^>]*)>')
+_RE_REL_ATTR = re.compile(r'rel="([^"]*)"')
+_RE_IMG = re.compile(r'<img\s([^>]+)>')
+_RE_CR_SECTION = re.compile(
+    r'(\s*<hr\s*/?>[\s\n]*<h3>Continue Reading</h3>[\s\n]*<ul>.*?</ul>)\s*$',
+    re.DOTALL | re.IGNORECASE)
+_RE_CR_LINK = re.compile(r'<a href="([^"]+)">([^<]+)</a>')
+_RE_IMG_WIDTH = re.compile(r'[?&]w=(\d+)')
+_RE_IMG_HEIGHT = re.compile(r'[?&]h=(\d+)')
+_RE_DESTINATION = re.compile(r"'([a-z0-9-]+)':\s*\{")
+_RE_SENTENCE_END = re.compile(r'(?<=[.!?])\s+')
+_RE_SLUG_BAD = re.compile(r'[^a-z0-9\-]')
+# ASCII slug cleanup: lowercase letters, anything outside [a-z0-9-] becomes '-'
+_SLUG_CHARS = 'abcdefghijklmnopqrstuvwxyz0123456789-'
+_SLUG_TABLE = {c: '-' for c in range(128) if chr(c) not in _SLUG_CHARS}
+_SLUG_TABLE.update({ord(c): c.lower() for c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'})
+
+_MOJIBAKE_ALT = '|'.join(re.escape(bad) for bad in sorted(MOJIBAKE_MAP, key=len, reverse=True))
+_RE_MOJIBAKE_ANY = re.compile(_MOJIBAKE_ALT)
+# Every content token the editorial layer rewrites, matched in a single pass.
+# The lookahead lets the engine skip positions no alternative can start at.
+_MOJIBAKE_LEAD = ''.join(sorted({bad[0] for bad in MOJIBAKE_MAP}))
+_RE_FIX_ALL = re.compile(
+    r'(?=[<' + re.escape(_MOJIBAKE_LEAD) + r'])(?:'
+    r'(?P<ext><a\s+href="https?://[^"]*"[^>]*>)'
+    r'|(?P<h1><h1[^>]*>|</h1>)'
+    r'|(?P<empty_p><p>\s*</p>)'
+    r'|(?P<mojibake>' + _MOJIBAKE_ALT + '))')
+
 
 # ─── Data class ──────────────────────────────────────────────────────────────
 
@@ -97,22 +140,35 @@ class Article:
     article_type: str = "cluster"  # "cluster" (500w min) or "pillar" (1200w min)
     keywords: list = None  # SEO keywords for JSON-LD
 
+    # Derived values, each stored with the content string it was computed from
+    _split_cache: tuple = field(default=None, init=False, repr=False, compare=False)
+    _wc_cache: tuple = field(default=None, init=False, repr=False, compare=False)
+    _issues_cache: tuple = field(default=None, init=False, repr=False, compare=False)
+    _stats_cache: tuple = field(default=None, init=False, repr=False, compare=False)
+
 
 # ─── Helpers ─────────────────────────────────────────────────────────────────
 
 def _split_continue_reading(content):
     """Split content into (body, cr_section) or (content, None)."""
-    pattern = r'(\s*<hr\s*/?>[\s\n]*<h3>Continue Reading</h3>[\s\n]*<ul>.*?</ul>)\s*$'
-    m = re.search(pattern, content, re.DOTALL | re.IGNORECASE)
+    m = _RE_CR_SECTION.search(content)
     if m:
         return content[:m.start()], m.group(1)
     return content, None
 
 
+def _get_body_cr(art):
+    """_split_continue_reading(art.content), cached until the content changes."""
+    cache = art._split_cache
+    if cache is None or cache[0] is not art.content:
+        cache = art._split_cache = (art.content, *_split_continue_reading(art.content))
+    return cache[1], cache[2]
+
+
 def _extract_cr_links(cr_html):
     if not cr_html:
         return []
-    return re.findall(r'<a href="([^"]+)">([^<]+)</a>', cr_html)
+    return _RE_CR_LINK.findall(cr_html)
 
 
 def _build_continue_reading(links):
@@ -120,6 +176,50 @@ def _build_continue_reading(links):
     return f'\n\n<hr />\n\n<h3>Continue Reading</h3>\n<ul>\n{items}\n</ul>'
 
 
+def _article_entries():
+    """DirEntry objects for the article JSON files, sorted by name."""
+    with os.scandir(ARTICLE_DIR) as it:
+        entries = [e for e in it if e.name.endswith('.json') and e.is_file()]
+    entries.sort(key=lambda e: e.name)
+    return entries
+
+
+def _load_json(path):
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _encode_json(data):
+    """data as 2-space indented UTF-8 JSON bytes.
+
+    For article payloads (strings, ints, lists, dicts) the bytes are the same
+    with or without orjson. Other values can differ: orjson writes 1e20 where
+    json writes 1e+20, and rejects integers wider than 64 bits.
+    """
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    # dumps + one write: json.dump issues a write() per token
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _write_file(path, payload):
+    """Write payload to path with raw os.write calls (no buffered file object)."""
+    # 0o666 less the umask, as open() would give
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _dump_json(path, data):
+    """Write data as 2-space indented UTF-8 JSON."""
+    _write_file(path, _encode_json(data))
+
+
 def _get_hub_url(art, explicit_hub=None):
     if explicit_hub:
         return explicit_hub
@@ -127,15 +227,105 @@ def _get_hub_url(art, explicit_hub=None):
 
 
 def _clean_word_count(content):
-    text = re.sub(r'<[^>]+>', ' ', content)
-    return len(text.split())
+    """Count words outside HTML tags.
+
+    Splits on tags and counts each text run in place, so no tag-stripped copy
+    of the whole content is built.
+    """
+    return sum(map(len, map(str.split, _RE_TAG_STRIP.split(content))))
+
+
+def _get_word_count(art):
+    """_clean_word_count(art.content), cached until the content changes."""
+    cache = art._wc_cache
+    if cache is None or cache[0] is not art.content:
+        cache = art._wc_cache = (art.content, _clean_word_count(art.content))
+    return cache[1]
+
+
+@dataclass
+class _ContentStats:
+    word_count: int = 0                                 # words in body (CR excluded)
+    headings: list = field(default_factory=list)        # heading levels in body, e.g. 2 for <h2>
+    body_links: list = field(default_factory=list)      # internal hrefs in body
+    internal_links: list = field(default_factory=list)  # internal hrefs in full content
+    ext_links: list = field(default_factory=list)       # (url, attrs) of external <a> tags
+    empty_p: int = 0
+    paras: list = field(default_factory=list)           # raw inner HTML of <p> blocks
+    imgs: list = field(default_factory=list)            # attribute text of <img> tags
+
+
+def _scan_content(content, body_end=None):
+    """Collect QC stats in one pass over the tags of content.
+
+    Everything before body_end counts as body (word count, headings, body links);
+    the rest is the Continue Reading section.
+    """
+    if body_end is None:
+        body_end = len(content)
+    stats = _ContentStats()
+    pos = 0
+    para_start = None     # end of the <p> opening the current paragraph
+    open_p_end = -1       # end of the previous tag, if it was <p>
+    for m in _RE_TAG_STRIP.finditer(content):
+        start, end = m.span()
+        in_body = start < body_end
+        if pos < body_end:
+            stats.word_count += len(content[pos:min(start, body_end)].split())
+        tag = m.group(0)
+        kind = tag[1]
+
+        if tag == '<p>':
+            if para_start is None:
+                para_start = end
+            pos = open_p_end = end
+            continue
+        if tag == '</p>':
+            if open_p_end >= 0 and not content[open_p_end:start].strip():
+                stats.empty_p += 1
+            if para_start is not None:
+                stats.paras.append(content[para_start:start])
+                para_start = None
+        elif kind == 'a':
+            ext = _RE_EXT_LINK_ATTR.match(tag)
+            if ext:
+                stats.ext_links.append(ext.groups())
+        elif kind == 'h':
+            level = ord(tag[2]) - 48  # '1'..'6' -> 1..6
+            if in_body and 1 <= level <= 6:
+                stats.headings.append(level)
+        elif kind == 'i':
+            img = _RE_IMG.match(tag)
+            if img:
+                stats.imgs.append(img.group(1))
+
+        if 'href="/' in tag:
+            links = _RE_HREF_INTERNAL.findall(tag)
+            stats.internal_links += links
+            if in_body:
+                stats.body_links += links
+        pos = end
+        open_p_end = -1
+
+    if pos < body_end:
+        stats.word_count += len(content[pos:body_end].split())
+    return stats
+
+
+def _get_stats(art):
+    """_scan_content(art.content) with the body/Continue Reading split, cached until the content changes."""
+    cache = art._stats_cache
+    if cache is None or cache[0] is not art.content:
+        body, _ = _get_body_cr(art)
+        cache = art._stats_cache = (art.content, _scan_content(art.content, len(body)))
+    return cache[1]
 
 
 def _extract_image_dimensions(url):
     """Extract width/height from Unsplash URL params (w=, h=)."""
     w = h = None
-    w_match = re.search(r'[?&]w=(\d+)', url)
-    h_match = re.search(r'[?&]h=(\d+)', url)
+    w_match = _RE_IMG_WIDTH.search(url)
+    h_match = _RE_IMG_HEIGHT.search(url)
     if w_match:
         w = int(w_match.group(1))
     if h_match:
@@ -145,41 +335,82 @@ def _extract_image_dimensions(url):
 
 def _has_mojibake(text):
     """Detect common mojibake patterns."""
-    for bad in MOJIBAKE_MAP:
-        if bad in text:
-            return True
-    return False
+    return _RE_MOJIBAKE_ANY.search(text) is not None
+
+
+def _scan_issues(content):
+    """Locate every token _fix_content rewrites. Returns [(start, end, kind), ...]."""
+    return [(m.start(), m.end(), m.lastgroup) for m in _RE_FIX_ALL.finditer(content)]
+
+
+def _get_issues(art):
+    """_scan_issues(art.content), cached until the content changes."""
+    cache = art._issues_cache
+    if cache is None or cache[0] is not art.content:
+        cache = art._issues_cache = (art.content, _scan_issues(art.content))
+    return cache[1]
+
+
+def _mtime_ns(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return None
 
 
 def _build_valid_urls():
-    """Build set of all valid internal URL paths from the project."""
+    """Build set of all valid internal URL paths from the project.
+
+    The scan is cached until the articles dir, pages dir or destinations file
+    changes; callers always get their own copy of the set.
+    """
+    global _VALID_URLS_CACHE
+    base = os.path.dirname(ARTICLE_DIR)  # src/data
+    pages_dir = os.path.join(os.path.dirname(base), 'pages')  # src/pages
+    dest_file = os.path.join(base, 'destinations.ts')
+    key = (ARTICLE_DIR, _mtime_ns(ARTICLE_DIR), _mtime_ns(pages_dir), _mtime_ns(dest_file))
+    if _VALID_URLS_CACHE is None or _VALID_URLS_CACHE[0] != key:
+        _VALID_URLS_CACHE = (key, frozenset(_scan_valid_urls(pages_dir, dest_file)))
+    return set(_VALID_URLS_CACHE[1])
+
+
+def _with_bare_urls(valid_urls):
+    """valid_urls plus each URL without its trailing slash, for bulk link lookups."""
+    return valid_urls | {u.rstrip('/') for u in valid_urls}
+
+
+def _broken_links(links, valid_urls):
+    """Links (in order, repeats kept) that match no valid URL with or without a trailing slash."""
+    unknown = set(links) - valid_urls
+    if not unknown:
+        return []
+    return [l for l in links if l in unknown and l.rstrip('/') + '/' not in valid_urls]
+
+
+def _scan_valid_urls(pages_dir, dest_file):
     valid = set()
     valid.add('/')
     valid.add('/articles/')
     valid.add('/destinations/')
     valid.add('/experiences/')
 
-    # Articles
+    # Articles — files are written as {slug}.json, so the name is the slug
     if os.path.isdir(ARTICLE_DIR):
-        for f in os.listdir(ARTICLE_DIR):
-            if f.endswith('.json'):
-                d = json.load(open(os.path.join(ARTICLE_DIR, f)))
-                valid.add(f'/articles/{d["slug"]}/')
+        for entry in _article_entries():
+            valid.add(f'/articles/{entry.name[:-5]}/')
 
     # City hubs
-    base = os.path.dirname(ARTICLE_DIR)  # src/data
-    pages_dir = os.path.join(os.path.dirname(base), 'pages')  # src/pages
-    for fname in os.listdir(pages_dir):
-        if fname.endswith('-ghost-tours.astro'):
-            slug = fname.replace('.astro', '')
-            valid.add(f'/{slug}/')
+    with os.scandir(pages_dir) as it:
+        for entry in it:
+            if entry.name.endswith('-ghost-tours.astro'):
+                slug = entry.name.replace('.astro', '')
+                valid.add(f'/{slug}/')
 
     # Destinations (from data file)
-    dest_file = os.path.join(base, 'destinations.ts')
     if os.path.exists(dest_file):
         with open(dest_file) as f:
             dest_content = f.read()
-        for m in re.findall(r"'([a-z0-9-]+)':\s*\{", dest_content):
+        for m in _RE_DESTINATION.findall(dest_content):
             valid.add(f'/destinations/{m}/')
 
     # Category pages
@@ -199,149 +430,206 @@ def _build_valid_urls():
 
 # ─── Stage 1: QC Layer ──────────────────────────────────────────────────────
 
-def _qc_one(art, hub_url=None, sibling_slugs=None, valid_urls=None, existing_slugs=None):
-    """Run full QC checks. Returns (fixable, blocking) issue lists."""
-    fixable = []
-    blocking = []
+# QC rule groups. _editorial_fix reports which groups its fixes may have
+# invalidated, so the final QC re-runs only those and reuses the rest.
+QC_TITLE, QC_EXCERPT, QC_SLUG, QC_FIELDS, QC_CONTENT, QC_CR = 1, 2, 4, 8, 16, 32
+QC_ALL = 63
+
+
+def _qc_one(art, hub_url=None, sibling_slugs=None, valid_urls=None, existing_slugs=None, groups=QC_ALL):
+    """Run the QC checks in `groups`. Returns {group: (fixable, blocking)} in check order."""
+    results = {}
     hub = _get_hub_url(art, hub_url)
+    hub_needle = hub.rstrip('/') if hub else None
     siblings = sibling_slugs or []
-    min_words = MIN_WORD_COUNT_PILLAR if art.article_type == 'pillar' else MIN_WORD_COUNT_CLUSTER
 
     # ── SEO: Title ──
-    rendered = f"{art.title}{BRAND_SUFFIX}"
-    if len(art.title) < MIN_TITLE:
-        blocking.append(f"title too short ({len(art.title)} chars, min {MIN_TITLE})")
-    elif len(rendered) > MAX_RENDERED_TITLE:
-        fixable.append(f"title too long: {len(art.title)} raw → {len(rendered)} rendered (max {MAX_RENDERED_TITLE})")
+    if groups & QC_TITLE:
+        fixable, blocking = results[QC_TITLE] = [], []
+        title_len = len(art.title)
+        rendered_len = title_len + _BRAND_LEN
+        if title_len < MIN_TITLE:
+            blocking.append(f"title too short ({title_len} chars, min {MIN_TITLE})")
+        elif rendered_len > MAX_RENDERED_TITLE:
+            fixable.append(f"title too long: {title_len} raw → {rendered_len} rendered (max {MAX_RENDERED_TITLE})")
+        if _has_mojibake(art.title):
+            fixable.append("title has mojibake characters")
 
     # ── SEO: Excerpt ──
-    if len(art.excerpt) < MIN_EXCERPT:
-        blocking.append(f"excerpt too short ({len(art.excerpt)} chars, min {MIN_EXCERPT})")
-    elif len(art.excerpt) > MAX_EXCERPT:
-        fixable.append(f"excerpt too long: {len(art.excerpt)} chars (max {MAX_EXCERPT})")
+    if groups & QC_EXCERPT:
+        fixable, blocking = results[QC_EXCERPT] = [], []
+        excerpt_len = len(art.excerpt)
+        if excerpt_len < MIN_EXCERPT:
+            blocking.append(f"excerpt too short ({excerpt_len} chars, min {MIN_EXCERPT})")
+        elif excerpt_len > MAX_EXCERPT:
+            fixable.append(f"excerpt too long: {excerpt_len} chars (max {MAX_EXCERPT})")
+        if _has_mojibake(art.excerpt):
+            fixable.append("excerpt has mojibake characters")
 
     # ── SEO: Slug ──
-    if art.slug != art.slug.lower() or re.search(r'[^a-z0-9A-Z\-]', art.slug) or art.slug.endswith('/'):
-        fixable.append(f"slug needs cleanup: \"{art.slug}\"")
-
-    # ── #5: Duplicate slug detection ──
-    if existing_slugs and art.slug in existing_slugs:
-        blocking.append(f"slug '{art.slug}' already exists on disk — would overwrite")
-
-    # ── #9: Absolute URL for featured image ──
-    if art.image_url and not art.image_url.startswith('https://'):
-        blocking.append(f"image_url must be absolute https:// URL (got: {art.image_url[:50]})")
-
-    # ── #13: Content depth (type-aware) ──
-    body, cr = _split_continue_reading(art.content)
-    wc = _clean_word_count(body)
-    if wc < min_words:
-        blocking.append(f"content too thin ({wc} words, min {min_words} for {art.article_type})")
-
-    # ── Required fields ──
-    if not art.image_url:
-        blocking.append("missing featured image URL")
-    if not art.image_alt:
-        blocking.append("missing featured image alt text")
-    if not art.category_slug:
-        blocking.append("missing category slug")
-    if not art.category_name:
-        blocking.append("missing category name")
-
-    # ── #24: Category registration (breadcrumbs) ──
-    if art.category_slug and art.category_slug not in CATEGORY_HUBS:
-        blocking.append(f"category '{art.category_slug}' not in CATEGORY_HUBS — add it before publishing")
-
-    # ── #6: Heading hierarchy ──
-    headings = re.findall(r'<(h[1-6])', body)
-    if 'h1' in headings:
-        fixable.append("content contains <h1> (conflicts with page title) — will downgrade to <h2>")
-    if headings and headings[0] not in ('h2', 'h3'):
-        fixable.append(f"first heading is <{headings[0]}> (should be <h2>)")
-    levels = [int(h[1]) for h in headings]
-    for i in range(1, len(levels)):
-        if levels[i] > levels[i-1] + 1:
-            fixable.append(f"heading jump: h{levels[i-1]} → h{levels[i]} (skipped h{levels[i-1]+1})")
-            break
+    if groups & QC_SLUG:
+        fixable, blocking = results[QC_SLUG] = [], []
+        # Uppercase letters and a trailing '/' fall outside [a-z0-9-] too
+        slug = art.slug
+        if _RE_SLUG_BAD.search(slug):
+            fixable.append(f"slug needs cleanup: \"{slug}\"")
+
+        # ── #5: Duplicate slug detection ──
+        if existing_slugs and slug in existing_slugs:
+            blocking.append(f"slug '{slug}' already exists on disk — would overwrite")
+
+    if groups & QC_FIELDS:
+        fixable, blocking = results[QC_FIELDS] = [], []
+        # ── #9: Absolute URL for featured image ──
+        if art.image_url and not art.image_url.startswith('https://'):
+            blocking.append(f"image_url must be absolute https:// URL (got: {art.image_url[:50]})")
+
+        # ── Required fields ──
+        if not art.image_url:
+            blocking.append("missing featured image URL")
+        if not art.image_alt:
+            blocking.append("missing featured image alt text")
+        if not art.category_slug:
+            blocking.append("missing category slug")
+        if not art.category_name:
+            blocking.append("missing category name")
+
+        # ── #24: Category registration (breadcrumbs) ──
+        if art.category_slug and art.category_slug not in CATEGORY_HUBS:
+            blocking.append(f"category '{art.category_slug}' not in CATEGORY_HUBS — add it before publishing")
+
+    if groups & QC_CONTENT:
+        fixable, blocking = results[QC_CONTENT] = [], []
+        stats = _get_stats(art)
+
+        # ── #13: Content depth (type-aware) ──
+        min_words = MIN_WORD_COUNT_PILLAR if art.article_type == 'pillar' else MIN_WORD_COUNT_CLUSTER
+        wc = stats.word_count
+        if wc < min_words:
+            blocking.append(f"content too thin ({wc} words, min {min_words} for {art.article_type})")
+
+        # ── #6: Heading hierarchy ──
+        levels = stats.headings
+        if 1 in levels:
+            fixable.append("content contains <h1> (conflicts with page title) — will downgrade to <h2>")
+        if levels and levels[0] not in (2, 3):
+            fixable.append(f"first heading is <h{levels[0]}> (should be <h2>)")
+        for prev, level in zip(levels, levels[1:]):
+            if level > prev + 1:
+                fixable.append(f"heading jump: h{prev} → h{level} (skipped h{prev+1})")
+                break
+
+        # ── #7: Mojibake detection ──
+        # Mojibake inside an <a>/<h1> token is matched as part of that token
+        content = art.content
+        if any(kind == 'mojibake' or (kind != 'empty_p' and _has_mojibake(content[start:end]))
+               for start, end, kind in _get_issues(art)):
+            fixable.append("content has mojibake characters — editorial will fix")
+
+        # ── #8: External link security ──
+        for url, attrs in stats.ext_links:
+            if 'noopener' not in attrs or 'noreferrer' not in attrs:
+                fixable.append(f"external link missing rel=\"noopener noreferrer\": {url[:60]}")
+                break  # report once
+
+        # ── #10: Empty content detection ──
+        if stats.empty_p:
+            fixable.append(f"{stats.empty_p} empty <p> tag(s)")
+
+        # ── #11: Duplicate paragraph detection ──
+        # Keyed on (length, prefix): full texts are only compared within a bucket
+        seen_paras = {}
+        for p in stats.paras:
+            clean = p.strip()
+            if len(clean) <= 50:
+                continue
+            bucket = seen_paras.setdefault((len(clean), clean[:32]), [])
+            if clean in bucket:
+                fixable.append("duplicate paragraph detected")
+                break
+            bucket.append(clean)
+
+        # ── #12: Inline image alt text ──
+        for img_attrs in stats.imgs:
+            if 'alt=' not in img_attrs or 'alt=""' in img_attrs:
+                fixable.append("inline <img> missing or empty alt text")
+                break
+
+        # ── Internal linking: body ──
+        body_links = stats.body_links
+        if len(body_links) < MIN_BODY_INTERNAL_LINKS:
+            fixable.append(f"body has {len(body_links)} internal link(s) (min {MIN_BODY_INTERNAL_LINKS})")
+
+        # ── #23: Broken internal link validation ──
+        if valid_urls:
+            for link in _broken_links(stats.internal_links, valid_urls):
+                fixable.append(f"internal link target may not exist: {link}")
+
+        # ── Hub link ──
+        if hub:
+            has_hub = any(hub_needle in link for link in stats.internal_links)
+            if not has_hub:
+                fixable.append(f"missing hub link ({hub})")
 
-    # ── #7: Mojibake detection ──
-    if _has_mojibake(art.content):
-        fixable.append("content has mojibake characters — editorial will fix")
-    if _has_mojibake(art.title):
-        fixable.append("title has mojibake characters")
-    if _has_mojibake(art.excerpt):
-        fixable.append("excerpt has mojibake characters")
-
-    # ── #8: External link security ──
-    ext_links = re.findall(r'<a\s+href="(https?://[^"]+)"([^>]*)>', art.content)
-    for url, attrs in ext_links:
-        if 'noopener' not in attrs or 'noreferrer' not in attrs:
-            fixable.append(f"external link missing rel=\"noopener noreferrer\": {url[:60]}")
-            break  # report once
-
-    # ── #10: Empty content detection ──
-    empty_p = re.findall(r'<p>\s*</p>', art.content)
-    if empty_p:
-        fixable.append(f"{len(empty_p)} empty <p> tag(s)")
-
-    # ── #11: Duplicate paragraph detection ──
-    paras = re.findall(r'<p>(.*?)</p>', art.content, re.DOTALL)
-    seen_paras = set()
-    for p in paras:
-        clean = p.strip()
-        if len(clean) > 50 and clean in seen_paras:
-            fixable.append("duplicate paragraph detected")
-            break
-        seen_paras.add(clean)
+    # ── Continue Reading section ──
+    if groups & QC_CR:
+        fixable, blocking = results[QC_CR] = [], []
+        _, cr = _get_body_cr(art)
+        if not cr:
+            fixable.append("no Continue Reading section")
+        else:
+            cr_links = _extract_cr_links(cr)
+            other_siblings = len(siblings) - siblings.count(art.slug)
+            available = (1 if hub else 0) + other_siblings
+            effective_min = min(MIN_CONTINUE_READING_LINKS, max(1, available))
+            if len(cr_links) < effective_min:
+                fixable.append(f"Continue Reading has {len(cr_links)} link(s) (min {effective_min})")
+            if hub and not any(hub_needle in url for url, _ in cr_links):
+                fixable.append(f"Continue Reading missing hub link ({hub})")
+            if siblings:
+                cr_urls = [url for url, _ in cr_links]
+                sibling_count = sum(1 for s in siblings if any(s in u for u in cr_urls))
+                min_siblings = min(2, other_siblings)
+                if sibling_count < min_siblings:
+                    fixable.append(f"Continue Reading has {sibling_count} sibling link(s) (min {min_siblings})")
+
+    return results
+
+
+def _qc_issues(results):
+    """Flatten _qc_one's per-group results into (fixable, blocking) issue lists."""
+    fixable, blocking = [], []
+    for f, b in results.values():
+        fixable += f
+        blocking += b
+    return fixable, blocking
 
-    # ── #12: Inline image alt text ──
-    imgs = re.findall(r'<img\s([^>]+)>', art.content)
-    for img_attrs in imgs:
-        if 'alt=' not in img_attrs or 'alt=""' in img_attrs:
-            fixable.append("inline <img> missing or empty alt text")
-            break
 
-    # ── Internal linking: body ──
-    body_links = re.findall(r'href="(/[^"]*)"', body)
-    if len(body_links) < MIN_BODY_INTERNAL_LINKS:
-        fixable.append(f"body has {len(body_links)} internal link(s) (min {MIN_BODY_INTERNAL_LINKS})")
-
-    # ── #23: Broken internal link validation ──
-    if valid_urls:
-        all_internal = re.findall(r'href="(/[^"]*)"', art.content)
-        for link in all_internal:
-            normalized = link.rstrip('/') + '/'
-            if normalized not in valid_urls:
-                # Also check without trailing slash
-                if link not in valid_urls:
-                    fixable.append(f"internal link target may not exist: {link}")
-
-    # ── Hub link ──
-    if hub:
-        all_links = re.findall(r'href="(/[^"]*)"', art.content)
-        has_hub = any(hub.rstrip('/') in link for link in all_links)
-        if not has_hub:
-            fixable.append(f"missing hub link ({hub})")
+def _qc_masked(art, groups, **kwargs):
+    # Positional (art, groups) so executor.map can zip both over the batch
+    return _qc_one(art, groups=groups, **kwargs)
 
-    # ── Continue Reading section ──
-    if not cr:
-        fixable.append("no Continue Reading section")
-    else:
-        cr_links = _extract_cr_links(cr)
-        available = (1 if hub else 0) + len([s for s in siblings if s != art.slug])
-        effective_min = min(MIN_CONTINUE_READING_LINKS, max(1, available))
-        if len(cr_links) < effective_min:
-            fixable.append(f"Continue Reading has {len(cr_links)} link(s) (min {effective_min})")
-        if hub and not any(hub.rstrip('/') in url for url, _ in cr_links):
-            fixable.append(f"Continue Reading missing hub link ({hub})")
-        if siblings:
-            cr_urls = [url for url, _ in cr_links]
-            sibling_count = sum(1 for s in siblings if any(s in u for u in cr_urls))
-            min_siblings = min(2, len([s for s in siblings if s != art.slug]))
-            if sibling_count < min_siblings:
-                fixable.append(f"Continue Reading has {sibling_count} sibling link(s) (min {min_siblings})")
 
-    return fixable, blocking
+def _qc_batch(articles, hub_url=None, sibling_slugs=None, valid_urls=None, existing_slugs=None, groups=None):
+    """_qc_one over a batch, in article order. Large batches are sharded across processes.
+
+    `groups`, if given, holds each article's QC_* mask; otherwise every group is checked.
+    """
+    if groups is None:
+        groups = [QC_ALL] * len(articles)
+    workers = os.cpu_count() or 1
+    # fork, not spawn: spawn re-imports the caller's script in every worker, and
+    # callers have no __main__ guard. fork is only safe on Linux — on macOS,
+    # forking after system frameworks have started threads can crash the child —
+    # so everywhere else QC stays serial.
+    if (len(articles) < PARALLEL_QC_MIN_ARTICLES or workers < 2
+            or not sys.platform.startswith('linux')):
+        return [_qc_one(art, hub_url, sibling_slugs, valid_urls, existing_slugs, g)
+                for art, g in zip(articles, groups)]
+    qc = functools.partial(_qc_masked, hub_url=hub_url, sibling_slugs=sibling_slugs,
+                           valid_urls=valid_urls, existing_slugs=existing_slugs)
+    with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('fork')) as ex:
+        return list(ex.map(qc, articles, groups, chunksize=max(1, len(articles) // (workers * 4))))
 
 
 # ─── Stage 2: Editorial Layer ────────────────────────────────────────────────
@@ -349,13 +637,11 @@ def _qc_one(art, hub_url=None, sibling_slugs=None, valid_urls=None, existing_slu
 def _truncate_title(title):
     if len(title) <= MAX_TITLE_RAW:
         return title
-    if ':' in title:
-        base = title[:title.rindex(':')].strip()
-        if MIN_TITLE <= len(base) <= MAX_TITLE_RAW:
-            return base
-    for sep in [' — ', ' – ', ' - ']:
-        if sep in title:
-            base = title[:title.rindex(sep)].strip()
+    # Separators in priority order: cut at the last occurrence of the first one that fits
+    for sep in (':', ' — ', ' – ', ' - '):
+        idx = title.rfind(sep)
+        if idx >= 0:
+            base = title[:idx].strip()
             if MIN_TITLE <= len(base) <= MAX_TITLE_RAW:
                 return base
     truncated = title[:MAX_TITLE_RAW - 3]
@@ -365,12 +651,20 @@ def _truncate_title(title):
     return truncated.rstrip('.,;:!? ') + "..."
 
 
+def _iter_sentences(text):
+    """Lazy _RE_SENTENCE_END.split(text), so callers can stop early."""
+    pos = 0
+    for m in _RE_SENTENCE_END.finditer(text):
+        yield text[pos:m.start()]
+        pos = m.end()
+    yield text[pos:]
+
+
 def _truncate_excerpt(excerpt):
     if len(excerpt) <= MAX_EXCERPT:
         return excerpt
-    sentences = re.split(r'(?<=[.!?])\s+', excerpt)
     built = ""
-    for s in sentences:
+    for s in _iter_sentences(excerpt):
         candidate = (built + " " + s).strip() if built else s
         if len(candidate) <= MAX_EXCERPT:
             built = candidate
@@ -386,44 +680,82 @@ def _truncate_excerpt(excerpt):
 
 
 def _fix_slug(slug):
-    slug = slug.lower().strip('/')
-    slug = re.sub(r'[^a-z0-9\-]', '-', slug)
-    slug = re.sub(r'-+', '-', slug)
-    return slug.strip('-')
+    if slug.isascii():
+        slug = slug.strip('/').translate(_SLUG_TABLE)
+    else:
+        slug = _RE_SLUG_BAD.sub('-', slug.lower().strip('/'))
+    # Collapse runs of '-' and trim them from both ends
+    return '-'.join(filter(None, slug.split('-')))
 
 
 def _fix_mojibake(text):
-    """Fix all known mojibake sequences."""
-    for bad, good in MOJIBAKE_MAP.items():
-        text = text.replace(bad, good)
-    return text
-
-
-def _fix_external_links(content):
-    """Add rel='noopener noreferrer' target='_blank' to external links."""
-    def fix_tag(m):
-        tag = m.group(0)
-        if 'rel=' not in tag:
-            tag = tag.replace('>', ' rel="noopener noreferrer" target="_blank">', 1)
-        elif 'noopener' not in tag:
-            tag = re.sub(r'rel="([^"]*)"', r'rel="\1 noopener noreferrer"', tag)
-        if 'target=' not in tag:
-            tag = tag.replace('>', ' target="_blank">', 1)
-        return tag
-
-    return re.sub(r'<a\s+href="https?://[^"]*"[^>]*>', fix_tag, content)
-
-
-def _fix_headings(content):
-    """Downgrade H1 to H2 in content."""
-    content = re.sub(r'<h1([^>]*)>', r'<h2\1>', content)
-    content = re.sub(r'</h1>', '</h2>', content)
-    return content
-
-
-def _fix_empty_paragraphs(content):
-    """Remove empty <p> tags."""
-    return re.sub(r'<p>\s*</p>', '', content)
+    """Fix all known mojibake sequences.
+
+    Repeats until none are left: fixing one sequence can complete another
+    (double-encoded 'Ã¢€™' → 'â€™' → '’').
+    """
+    while True:
+        fixed = _RE_MOJIBAKE_ANY.sub(lambda m: MOJIBAKE_MAP[m.group(0)], text)
+        if fixed == text:
+            return fixed
+        text = fixed
+
+
+def _fix_external_tag(tag):
+    """Add rel='noopener noreferrer' target='_blank' to an external <a> tag."""
+    if 'rel=' not in tag:
+        tag = tag.replace('>', ' rel="noopener noreferrer" target="_blank">', 1)
+    elif 'noopener' not in tag:
+        tag = _RE_REL_ATTR.sub(r'rel="\1 noopener noreferrer"', tag)
+    if 'target=' not in tag:
+        tag = tag.replace('>', ' target="_blank">', 1)
+    return tag
+
+
+def _fix_content(content, issues=None):
+    """Fix mojibake, external link security, <h1> and empty <p> tags.
+
+    issues is content's _scan_issues() result, computed here if not given.
+    Returns (content, kinds) where kinds is the set of fixes that applied:
+    'mojibake', 'ext', 'h1', 'empty_p'.
+    """
+    if issues is None:
+        issues = _scan_issues(content)
+    kinds = set()
+    parts = []
+    pos = 0
+    for start, end, kind in issues:
+        token = content[start:end]
+        if kind == 'mojibake':
+            kinds.add(kind)
+            fixed = MOJIBAKE_MAP[token]
+        elif kind == 'empty_p':
+            kinds.add(kind)
+            fixed = ''
+        else:
+            fixed = token
+            if _has_mojibake(fixed):
+                kinds.add('mojibake')
+                fixed = _fix_mojibake(fixed)
+            if kind == 'h1':
+                kinds.add(kind)
+                fixed = fixed.replace('h1', 'h2', 1)
+            elif 'noopener' not in fixed or 'target' not in fixed:
+                kinds.add(kind)
+                fixed = _fix_external_tag(fixed)
+            if fixed == token:
+                continue
+        parts.append(content[pos:start])
+        parts.append(fixed)
+        pos = end
+    if not parts:
+        return content, kinds
+    parts.append(content[pos:])
+    content = ''.join(parts)
+    if 'mojibake' in kinds and _has_mojibake(content):
+        # A fixed sequence completed a new one with its neighbours
+        content = _fix_mojibake(content)
+    return content, kinds
 
 
 HUB_LABELS = {
@@ -450,17 +782,23 @@ HUB_LABELS = {
 
 
 def _editorial_fix(articles, hub_url=None):
-    """Apply all auto-fixes in-place. Returns fix log."""
+    """Apply all auto-fixes in-place.
+
+    Returns (fix log, dirty) where dirty holds, per article, the QC_* groups
+    whose inputs the fixes touched.
+    """
     log = []
+    dirty = []
+    all_articles = tuple(articles)
 
-    for art in articles:
+    for art in all_articles:
         fixes = []
+        before = (art.title, art.excerpt, art.slug, art.content)
         hub = _get_hub_url(art, hub_url)
-        siblings = [a for a in articles if a.slug != art.slug]
+        hub_needle = hub.rstrip('/') if hub else None
 
         # ── Title ──
-        rendered = f"{art.title}{BRAND_SUFFIX}"
-        if len(rendered) > MAX_RENDERED_TITLE:
+        if len(art.title) + _BRAND_LEN > MAX_RENDERED_TITLE:
             old = art.title
             art.title = _truncate_title(art.title)
             fixes.append(f"title: \"{old}\" ({len(old)}) → \"{art.title}\" ({len(art.title)})")
@@ -477,9 +815,11 @@ def _editorial_fix(articles, hub_url=None):
             fixes.append(f"slug: \"{art.slug}\" → \"{clean}\"")
             art.slug = clean
 
-        # ── #14: Mojibake ──
-        if _has_mojibake(art.content):
-            art.content = _fix_mojibake(art.content)
+        # ── #14-16, #10: Mojibake, external links, H1 downgrade, empty paragraphs ──
+        content, kinds = _fix_content(art.content, _get_issues(art))
+        if kinds:
+            art.content = content
+        if 'mojibake' in kinds:
             fixes.append("fixed mojibake in content")
         if _has_mojibake(art.title):
             art.title = _fix_mojibake(art.title)
@@ -487,31 +827,20 @@ def _editorial_fix(articles, hub_url=None):
         if _has_mojibake(art.excerpt):
             art.excerpt = _fix_mojibake(art.excerpt)
             fixes.append("fixed mojibake in excerpt")
-
-        # ── #15: External link security ──
-        ext_links = re.findall(r'<a\s+href="https?://[^"]*"[^>]*>', art.content)
-        needs_fix = any('noopener' not in tag or 'target' not in tag for tag in ext_links)
-        if needs_fix:
-            art.content = _fix_external_links(art.content)
+        if 'ext' in kinds:
             fixes.append("added rel/target to external links")
-
-        # ── #16: H1 downgrade ──
-        if '<h1' in art.content:
-            art.content = _fix_headings(art.content)
+        if 'h1' in kinds:
             fixes.append("downgraded <h1> to <h2>")
-
-        # ── #10: Empty paragraphs ──
-        if re.search(r'<p>\s*</p>', art.content):
-            art.content = _fix_empty_paragraphs(art.content)
+        if 'empty_p' in kinds:
             fixes.append("removed empty <p> tags")
 
         # ── Continue Reading ──
-        body, existing_cr = _split_continue_reading(art.content)
+        body, existing_cr = _get_body_cr(art)
 
         if existing_cr:
             cr_links = _extract_cr_links(existing_cr)
             cr_modified = False
-            if hub and not any(hub.rstrip('/') in url for url, _ in cr_links):
+            if hub and not any(hub_needle in url for url, _ in cr_links):
                 cr_links.append((hub, HUB_LABELS.get(hub, 'Ghost Tours Hub')))
                 cr_modified = True
                 fixes.append(f"injected hub link ({hub}) into Continue Reading")
@@ -519,8 +848,12 @@ def _editorial_fix(articles, hub_url=None):
                 art.content = body + _build_continue_reading(cr_links)
         else:
             cr_links = []
-            for sib in siblings[:4]:
+            for sib in all_articles:
+                if sib.slug == art.slug:
+                    continue
                 cr_links.append((f"/articles/{sib.slug}/", sib.title))
+                if len(cr_links) == 4:
+                    break
             if hub:
                 cr_links.append((hub, HUB_LABELS.get(hub, 'Ghost Tours Hub')))
             if cr_links:
@@ -530,61 +863,103 @@ def _editorial_fix(articles, hub_url=None):
         if fixes:
             log.append((art.slug, fixes))
 
-    return log
+        title, excerpt, slug, content = before
+        mask = 0
+        if art.title != title:
+            mask |= QC_TITLE
+        if art.excerpt != excerpt:
+            mask |= QC_EXCERPT
+        if art.slug != slug:
+            mask |= QC_SLUG
+        if art.content != content:
+            mask |= QC_CONTENT | QC_CR
+        dirty.append(mask)
+
+    # A renamed slug changes every article's sibling list and link targets
+    if any(mask & QC_SLUG for mask in dirty):
+        dirty = [mask | QC_CONTENT | QC_CR for mask in dirty]
+
+    return log, dirty
 
 
 # ─── Stage 3: Write Layer ────────────────────────────────────────────────────
 
+def _encode_article(i, art):
+    """(path, JSON bytes) for one article."""
+    wc = _get_word_count(art)
+    w, h = _extract_image_dimensions(art.image_url)
+
+    img_data = {
+        "sourceUrl": art.image_url,
+        "altText": art.image_alt,
+    }
+    if w:
+        img_data["width"] = w
+    if h:
+        img_data["height"] = h
+
+    data = {
+        "title": art.title,
+        "slug": art.slug,
+        "id": art.article_id or (70000 + i),
+        "status": "publish",
+        "post_type": "post",
+        "uri": f"/articles/{art.slug}/",
+        "date": art.date,
+        "modified": art.date,
+        "content": art.content,
+        "excerpt": art.excerpt,
+        "wordCount": wc,
+        "readingTime": max(1, round(wc / 250)),
+        "articleType": art.article_type,
+        "categories": [{
+            "id": art.category_id or 0,
+            "slug": art.category_slug,
+            "name": art.category_name,
+            "description": art.category_description,
+        }],
+        "pageType": "unassigned",
+        "featuredImage": img_data,
+    }
+
+    if art.keywords:
+        data["keywords"] = art.keywords
+
+    return os.path.join(ARTICLE_DIR, f"{art.slug}.json"), _encode_json(data)
+
+
+def _encode_all(articles):
+    """Encode every article up front, so no encoding happens between writes."""
+    return [_encode_article(i, art) for i, art in enumerate(articles)]
+
+
+def _flush_all(items):
+    """Write (path, payload) pairs. Writes are I/O-bound; threads overlap the syscalls.
+
+    Pairs sharing a path are collapsed to the last one first: two threads
+    truncating and writing the same file could interleave into invalid JSON.
+    """
+    items = dict(items)
+    if not items:
+        return
+    paths, payloads = zip(*items.items())
+    with ThreadPoolExecutor(max_workers=min(16, len(items))) as ex:
+        list(ex.map(_write_file, paths, payloads))
+
+
 def _write_to_disk(articles):
-    os.makedirs(ARTICLE_DIR, exist_ok=True)
-    for i, art in enumerate(articles):
-        wc = _clean_word_count(art.content)
-        w, h = _extract_image_dimensions(art.image_url)
-
-        img_data = {
-            "sourceUrl": art.image_url,
-            "altText": art.image_alt,
-        }
-        if w:
-            img_data["width"] = w
-        if h:
-            img_data["height"] = h
-
-        data = {
-            "title": art.title,
-            "slug": art.slug,
-            "id": art.article_id or (70000 + i),
-            "status": "publish",
-            "post_type": "post",
-            "uri": f"/articles/{art.slug}/",
-            "date": art.date,
-            "modified": art.date,
-            "content": art.content,
-            "excerpt": art.excerpt,
-            "wordCount": wc,
-            "readingTime": max(1, round(wc / 250)),
-            "articleType": art.article_type,
-            "categories": [{
-                "id": art.category_id or 0,
-                "slug": art.category_slug,
-                "name": art.category_name,
-                "description": art.category_description,
-            }],
-            "pageType": "unassigned",
-            "featuredImage": img_data,
-        }
-
-        if art.keywords:
-            data["keywords"] = art.keywords
-
-        with open(os.path.join(ARTICLE_DIR, f"{art.slug}.json"), "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+    global _MADE_ARTICLE_DIR
+    if _MADE_ARTICLE_DIR != ARTICLE_DIR:
+        os.makedirs(ARTICLE_DIR, exist_ok=True)
+        _MADE_ARTICLE_DIR = ARTICLE_DIR
+    _flush_all(_encode_all(articles))
 
 
 # ─── Pipeline ────────────────────────────────────────────────────────────────
 
 def publish_articles(articles, hub_url=None):
     """Full pipeline: QC → Editorial → Final QC → Write. Returns True if published."""
+    articles = list(articles)  # iterated once per stage; accept any iterable
     n = len(articles)
     sibling_slugs = [a.slug for a in articles]
 
@@ -593,13 +968,12 @@ def publish_articles(articles, hub_url=None):
     # Also add the new articles being published
     for a in articles:
         valid_urls.add(f'/articles/{a.slug}/')
+    valid_urls = _with_bare_urls(valid_urls)
 
     # Get existing slugs on disk to check for collisions
     existing_slugs = set()
     if os.path.isdir(ARTICLE_DIR):
-        for f in os.listdir(ARTICLE_DIR):
-            if f.endswith('.json'):
-                existing_slugs.add(f.replace('.json', ''))
+        existing_slugs = {entry.name[:-5] for entry in _article_entries()}
 
     print()
     print("=" * 62)
@@ -608,12 +982,10 @@ def publish_articles(articles, hub_url=None):
 
     # ── Stage 1: QC ──
     print(f"\n  ┌─ STAGE 1: QC CHECK")
-    total_fixable = 0
-    total_blocking = 0
-    for art in articles:
-        fixable, blocking = _qc_one(art, hub_url, sibling_slugs, valid_urls, existing_slugs)
-        total_fixable += len(fixable)
-        total_blocking += len(blocking)
+    qc_results = _qc_batch(articles, hub_url, sibling_slugs, valid_urls, existing_slugs)
+    qc_issues = [_qc_issues(results) for results in qc_results]
+    total_fixable = sum(len(fixable) for fixable, _ in qc_issues)
+    total_blocking = sum(len(blocking) for _, blocking in qc_issues)
 
     if total_fixable == 0 and total_blocking == 0:
         print(f"  │  ✓ All {n} articles clean")
@@ -622,8 +994,7 @@ def publish_articles(articles, hub_url=None):
             print(f"  │  ⚠ {total_fixable} fixable issue(s) → editorial layer")
         if total_blocking:
             print(f"  │  ✗ {total_blocking} BLOCKING issue(s):")
-            for art in articles:
-                _, blocking = _qc_one(art, hub_url, sibling_slugs, valid_urls, existing_slugs)
+            for art, (_, blocking) in zip(articles, qc_issues):
                 for b in blocking:
                     print(f"  │      {art.slug}: {b}")
             print(f"  └─ ABORTED\n")
@@ -632,7 +1003,7 @@ def publish_articles(articles, hub_url=None):
 
     # ── Stage 2: Editorial Fix ──
     print(f"\n  ┌─ STAGE 2: EDITORIAL FIX")
-    fix_log = _editorial_fix(articles, hub_url)
+    fix_log, dirty = _editorial_fix(articles, hub_url)
     if fix_log:
         print(f"  │  Fixed {len(fix_log)} article(s):")
         for slug, fixes in fix_log:
@@ -649,9 +1020,15 @@ def publish_articles(articles, hub_url=None):
         valid_urls.add(f'/articles/{a.slug}/')
 
     print(f"\n  ┌─ STAGE 3: FINAL QC")
+    # Only groups the editorial fixes touched are re-checked; the rest keep
+    # their Stage 1 results (which had no blocking issues, or we'd have aborted).
+    # Untouched articles skip _qc_batch entirely, so a clean batch does no QC work.
+    touched = [i for i, mask in enumerate(dirty) if mask]
+    rechecked = dict(zip(touched, _qc_batch([articles[i] for i in touched], hub_url, sibling_slugs,
+                                            valid_urls, groups=[dirty[i] for i in touched])))
     remaining = 0
-    for art in articles:
-        fixable, blocking = _qc_one(art, hub_url, sibling_slugs, valid_urls, None)
+    for i, (art, before) in enumerate(zip(articles, qc_results)):
+        fixable, blocking = _qc_issues({**before, **rechecked.get(i, {})})
         for issue in fixable + blocking:
             print(f"  │  ✗ {art.slug}: {issue}")
             remaining += 1
@@ -667,19 +1044,22 @@ def publish_articles(articles, hub_url=None):
     # ── Stage 4: Write ──
     print(f"\n  ┌─ STAGE 4: WRITE")
     _write_to_disk(articles)
-    total_words = sum(_clean_word_count(a.content) for a in articles)
+    total_words = sum(_get_word_count(a) for a in articles)
     print(f"  │  ✓ {n} articles ({total_words:,} words) → {ARTICLE_DIR}/")
 
+    # One write for the whole per-article report rather than two prints per article
+    report = []
     for art in articles:
-        rendered = f"{art.title}{BRAND_SUFFIX}"
-        body, cr = _split_continue_reading(art.content)
-        body_links = len(re.findall(r'href="(/[^"]*)"', body))
+        rendered_len = len(art.title) + _BRAND_LEN
+        _, cr = _get_body_cr(art)
+        body_links = len(_get_stats(art).body_links)
         cr_links = len(_extract_cr_links(cr)) if cr else 0
-        wc = _clean_word_count(art.content)
+        wc = _get_word_count(art)
         hub = _get_hub_url(art, hub_url)
         hub_status = "✓hub" if hub and hub in art.content else ("—" if not hub else "✗hub")
-        print(f"  │    ✓ {art.slug}")
-        print(f"  │        {len(rendered)}t | {len(art.excerpt)}e | {wc}w | {body_links}+{cr_links} links | {hub_status} | {art.article_type}")
+        report.append(f"  │    ✓ {art.slug}\n"
+                      f"  │        {rendered_len}t | {len(art.excerpt)}e | {wc}w | {body_links}+{cr_links} links | {hub_status} | {art.article_type}\n")
+    sys.stdout.write(''.join(report))
 
     print(f"  └─ Done")
     print(f"\n  ✓ {n} articles published.")
@@ -694,12 +1074,9 @@ def repair_hub_links():
     """Inject missing hub links into Continue Reading sections."""
     print(f"\n  Repairing hub links...\n")
     repaired = 0
-    for fname in sorted(os.listdir(ARTICLE_DIR)):
-        if not fname.endswith('.json'):
-            continue
-        path = os.path.join(ARTICLE_DIR, fname)
-        with open(path) as f:
-            d = json.load(f)
+    for entry in _article_entries():
+        path = entry.path
+        d = _load_json(path)
         cat_slug = d['categories'][0]['slug'] if d.get('categories') else ''
         hub = CATEGORY_HUBS.get(cat_slug)
         if not hub or hub.rstrip('/') in d.get('content', ''):
@@ -710,8 +1087,7 @@ def repair_hub_links():
         cr_links = _extract_cr_links(cr)
         cr_links.append((hub, HUB_LABELS.get(hub, 'Ghost Tours Hub')))
         d['content'] = body + _build_continue_reading(cr_links)
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(d, f, indent=2, ensure_ascii=False)
+        _dump_json(path, d)
         print(f"    ✓ {d['slug']}: injected {hub}")
         repaired += 1
     print(f"\n  Repaired {repaired} articles.\n")
@@ -722,20 +1098,17 @@ def repair_all():
     """Fix hub links + mojibake + external link security on all existing articles."""
     print(f"\n  Full repair on existing articles...\n")
     total_fixed = 0
-    for fname in sorted(os.listdir(ARTICLE_DIR)):
-        if not fname.endswith('.json'):
-            continue
-        path = os.path.join(ARTICLE_DIR, fname)
-        with open(path) as f:
-            d = json.load(f)
+    for entry in _article_entries():
+        path = entry.path
+        d = _load_json(path)
 
         fixes = []
         content = d.get('content', '')
         original = content
 
-        # Mojibake
-        if _has_mojibake(content):
-            content = _fix_mojibake(content)
+        # Mojibake, external links, H1 in content, empty paragraphs
+        content, kinds = _fix_content(content)
+        if 'mojibake' in kinds:
             fixes.append("mojibake")
         if _has_mojibake(d.get('title', '')):
             d['title'] = _fix_mojibake(d['title'])
@@ -743,22 +1116,11 @@ def repair_all():
         if _has_mojibake(d.get('excerpt', '')):
             d['excerpt'] = _fix_mojibake(d['excerpt'])
             fixes.append("excerpt mojibake")
-
-        # External links
-        ext_links = re.findall(r'<a\s+href="https?://[^"]*"[^>]*>', content)
-        needs_fix = any('noopener' not in tag or 'target' not in tag for tag in ext_links)
-        if needs_fix:
-            content = _fix_external_links(content)
+        if 'ext' in kinds:
             fixes.append("ext link security")
-
-        # H1 in content
-        if '<h1' in content:
-            content = _fix_headings(content)
+        if 'h1' in kinds:
             fixes.append("h1 downgrade")
-
-        # Empty paragraphs
-        if re.search(r'<p>\s*</p>', content):
-            content = _fix_empty_paragraphs(content)
+        if 'empty_p' in kinds:
             fixes.append("empty <p>")
 
         # Hub link
@@ -774,8 +1136,7 @@ def repair_all():
 
         if fixes:
             d['content'] = content
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(d, f, indent=2, ensure_ascii=False)
+            _dump_json(path, d)
             print(f"    ✓ {d['slug']}: {', '.join(fixes)}")
             total_fixed += 1
 
@@ -790,12 +1151,9 @@ def backfill_enrichment():
     print(f"\n  Backfilling enrichment fields...\n")
     updated = 0
 
-    for fname in sorted(os.listdir(ARTICLE_DIR)):
-        if not fname.endswith('.json'):
-            continue
-        path = os.path.join(ARTICLE_DIR, fname)
-        with open(path) as f:
-            d = json.load(f)
+    for entry in _article_entries():
+        path = entry.path
+        d = _load_json(path)
 
         changes = []
         content = d.get('content', '')
@@ -831,8 +1189,7 @@ def backfill_enrichment():
             d['featuredImage'] = img
 
         if changes:
-            with open(path, 'w', encoding='utf-8') as f:
-                json.dump(d, f, indent=2, ensure_ascii=False)
+            _dump_json(path, d)
             print(f"    ✓ {d['slug']}: {', '.join(changes)}")
             updated += 1
 
@@ -870,17 +1227,18 @@ def audit_existing():
     """Full audit of all existing article JSON files."""
     print(f"\n  Auditing {ARTICLE_DIR}/\n")
     valid_urls = _build_valid_urls()
+    link_targets = _with_bare_urls(valid_urls)
     errors = []
     count = 0
 
-    for fname in sorted(os.listdir(ARTICLE_DIR)):
-        if not fname.endswith(".json"):
-            continue
-        with open(os.path.join(ARTICLE_DIR, fname)) as f:
-            d = json.load(f)
+    entries = _article_entries()
+    # Files are independent and only read, so the loads overlap on a thread pool
+    with ThreadPoolExecutor(max_workers=max(1, min(32, len(entries)))) as ex:
+        docs = list(ex.map(_load_json, [entry.path for entry in entries]))
 
+    for entry, d in zip(entries, docs):
         count += 1
-        slug = d.get("slug", fname.replace(".json", ""))
+        slug = d.get("slug", entry.name[:-5])
         title = d.get("title", "")
         excerpt = d.get("excerpt", "")
         content = d.get("content", "")
@@ -889,18 +1247,19 @@ def audit_existing():
         cat_slug = cats[0]['slug'] if cats else ''
         hub = CATEGORY_HUBS.get(cat_slug)
 
-        rendered = f"{title}{BRAND_SUFFIX}"
+        rendered_len = len(title) + _BRAND_LEN
         body, cr = _split_continue_reading(content)
-        body_wc = _clean_word_count(body)
-        body_links = len(re.findall(r'href="(/[^"]*)"', body))
+        stats = _scan_content(content, len(body))
+        body_wc = stats.word_count
+        body_links = len(stats.body_links)
         cr_links = _extract_cr_links(cr) if cr else []
         has_hub = hub and hub.rstrip('/') in content
 
         issues = []
 
         # SEO
-        if len(rendered) > MAX_RENDERED_TITLE:
-            issues.append(f"title {len(rendered)} chars (max {MAX_RENDERED_TITLE})")
+        if rendered_len > MAX_RENDERED_TITLE:
+            issues.append(f"title {rendered_len} chars (max {MAX_RENDERED_TITLE})")
         if len(title) < MIN_TITLE:
             issues.append(f"title {len(title)} chars (min {MIN_TITLE})")
         if len(excerpt) > MAX_EXCERPT:
@@ -934,18 +1293,15 @@ def audit_existing():
         # Content quality
         if _has_mojibake(content) or _has_mojibake(title) or _has_mojibake(excerpt):
             issues.append("mojibake detected")
-        headings = re.findall(r'<(h[1-6])', body)
-        if 'h1' in headings:
+        if 1 in stats.headings:
             issues.append("h1 in content")
-        if re.search(r'<p>\s*</p>', content):
+        if stats.empty_p:
             issues.append("empty <p> tags")
-        ext = re.findall(r'<a\s+href="https?://[^"]*"([^>]*)>', content)
-        if any('noopener' not in a for a in ext):
+        if any('noopener' not in attrs for _, attrs in stats.ext_links):
             issues.append("ext links missing noopener")
 
         # Broken internal links
-        all_internal = re.findall(r'href="(/[^"]*)"', content)
-        broken = [l for l in all_internal if (l.rstrip('/') + '/') not in valid_urls and l not in valid_urls]
+        broken = _broken_links(stats.internal_links, link_targets)
         if broken:
             issues.append(f"{len(broken)} broken internal link(s): {broken[0]}")
 
@@ -964,8 +1320,7 @@ def audit_existing():
 
     if errors:
         print(f"  ✗ {len(errors)} of {count} articles have issues:\n")
-        for slug, issues in errors:
-            print(f"    {slug}: {'; '.join(issues)}")
+        sys.stdout.write(''.join(f"    {slug}: {'; '.join(issues)}\n" for slug, issues in errors))
         print()
         return False
     else:
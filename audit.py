@@ -63,7 +63,7 @@ def validate_page(filepath, html):
     page_type = classify_page(rel)
     schema_types = get_schemas(html)
     text_only = re.sub(r'<[^>]+>', ' ', html)
-    word_count = len(re.sub(r'\s+', ' ', text_only).split())
+    word_count = len(text_only.split())
     internal_links = len(re.findall(r'href="\/[^"]*"', html))
     h1s = extract_all(html, r'<h1[^>]*>([^<]+)</h1>')
     h2s = extract_all(html, r'<h2[^>]*>([^<]+)</h2>')